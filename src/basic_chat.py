@@ -1,5 +1,6 @@
 """Basic chat interactions with multiple models"""
 
+import asyncio
 from typing import Dict
 
 from langchain_core.language_models import BaseChatModel
@@ -9,6 +10,10 @@ from langchain_core.messages import HumanMessage, SystemMessage
 async def demonstrate_basic_chat(models: Dict[str, BaseChatModel]):
     """Demonstrate basic chat with all available models"""
 
+    # Snapshot the models once; tuples iterate faster than dict views
+    # in the loops below
+    model_items = tuple(models.items())
+
     # Test message
     messages = [
         SystemMessage(content="You are a helpful AI assistant."),
@@ -17,44 +22,63 @@ async def demonstrate_basic_chat(models: Dict[str, BaseChatModel]):
 
     print("Testing basic chat with all models...\n")
 
-    # Synchronous example
-    for name, model in models.items():
+    # Fan out one request per model and let the round-trips overlap
+    responses = await asyncio.gather(
+        *(model.ainvoke(messages) for _, model in model_items),
+        return_exceptions=True,
+    )
+
+    for (name, _), response in zip(model_items, responses):
         print(f"--- {name.upper()} Response ---")
-        try:
-            response = model.invoke(messages)
+        if isinstance(response, Exception):
+            print(f"Error: {response}\n")
+        else:
             print(f"{response.content}\n")
-        except Exception as e:
-            print(f"Error: {e}\n")
 
     # Temperature comparison
     print("\n=== Temperature Comparison ===")
     prompt = "Write a creative haiku about programming"
 
-    for temp in [0.1, 0.6, 1.0]:
+    # One leg per model/temperature pair: a single network fan-out
+    # instead of nine sequential model builds and calls. model_copy
+    # shallow-copies the model with the new temperature, so the warm
+    # HTTP clients are reused and no provider sees an unexpected
+    # call-time kwarg (ollama rejects bind(temperature=...)).
+    # return_exceptions keeps one failing leg from discarding the
+    # others' output.
+    temps = (0.1, 0.6, 1.0)
+    legs = {
+        f"{name}@{temp}": (
+            model.model_copy(update={"temperature": temp})
+            if hasattr(model, "temperature")
+            else model
+        )
+        for temp in temps
+        for name, model in model_items
+    }
+
+    leg_results = await asyncio.gather(
+        *(leg.ainvoke(prompt) for leg in legs.values()),
+        return_exceptions=True,
+    )
+    results = dict(zip(legs, leg_results))
+
+    for temp in temps:
         print(f"\nTemperature: {temp}")
 
-        for name, model in models.items():
-            # Clone model with new temperature
-            try:
-                if hasattr(model, "temperature"):
-                    # Use the config to recreate models with new temperature
-                    from src.config import config
-
-                    model_with_temp = config.get_model(name, temperature=temp)
-                else:
-                    model_with_temp = model
-
-                print(f"\n{name}:")
-                response = model_with_temp.invoke(prompt)
+        for name, _ in model_items:
+            response = results[f"{name}@{temp}"]
+            print(f"\n{name}:")
+            if isinstance(response, Exception):
+                print(f"Error: {response}")
+            else:
                 print(response.content)
-            except Exception as e:
-                print(f"Error with {name}: {e}")
 
     # Streaming example
     print("\n=== Streaming Example ===")
     stream_prompt = "Count from 1 to 5 slowly, with a description for each number."
 
-    for name, model in models.items():
+    for name, model in model_items:
         print(f"\n{name} streaming:")
         try:
             async for chunk in model.astream(stream_prompt):
@@ -70,7 +94,7 @@ if __name__ == "__main__":
     from src.config import setup_and_get_models
 
     async def main():
-        models = setup_and_get_models()
+        models = await setup_and_get_models()
         if models:
             print("\n" + "=" * 60)
             print("  Basic Chat Interactions")
@@ -1,20 +1,40 @@
 """Configuration for multi-model LLM setup"""
 
+import asyncio
 import os
 from typing import Optional
 
+import httpx
 from dotenv import load_dotenv
-from langchain_anthropic import ChatAnthropic
+from langchain_community.cache import SQLiteCache
+from langchain_core.globals import set_llm_cache
 from langchain_core.language_models import BaseChatModel
-from langchain_ollama import ChatOllama
-from langchain_openai import ChatOpenAI
+
+# Provider SDKs (langchain_openai, langchain_anthropic, langchain_ollama)
+# are imported lazily inside get_model so startup only pays for the
+# providers actually used
 
 # Load environment variables
 load_dotenv()
 
+# Cache model responses across runs - the demos re-issue identical
+# prompts, so repeated runs skip the network entirely.
+# Disable with LLM_CACHE=0.
+if os.getenv("LLM_CACHE", "1") != "0":
+    set_llm_cache(
+        SQLiteCache(database_path=os.getenv("LLM_CACHE_PATH", ".llm_cache.db"))
+    )
+
 
 class ModelConfig:
-    """Configuration for multi-model setup"""
+    """Configuration for multi-model setup
+
+    Ollama server-side parallelism is tuned via OLLAMA_NUM_PARALLEL
+    (concurrent requests per loaded model, default 4) and
+    OLLAMA_MAX_LOADED_MODELS (models kept in memory, default 1). Without
+    these the gather-based demos serialize inside the Ollama server even
+    though the client dispatches concurrently.
+    """
 
     def __init__(self):
         self.provider = os.getenv("LLM_PROVIDER", "openai").lower()
@@ -24,6 +44,21 @@ class ModelConfig:
         self.anthropic_model = os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-20250514")
         self.ollama_model = os.getenv("OLLAMA_MODEL", "gemma3:27b")
         self.ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+        self.ollama_num_parallel = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+        self.ollama_max_loaded_models = int(os.getenv("OLLAMA_MAX_LOADED_MODELS", "1"))
+
+        # Exported so an Ollama server launched from this process honours
+        # the same parallelism settings as the client-side demos
+        os.environ["OLLAMA_NUM_PARALLEL"] = str(self.ollama_num_parallel)
+        os.environ["OLLAMA_MAX_LOADED_MODELS"] = str(self.ollama_max_loaded_models)
+
+        # One HTTP/2 connection pool shared by every model instance so
+        # concurrent demos multiplex streams instead of re-handshaking
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=60,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
 
     def get_model(
         self, provider: Optional[str] = None, temperature: float = 0.7
@@ -34,15 +69,20 @@ class ModelConfig:
         if provider == "openai":
             if not self.openai_api_key:
                 raise ValueError("OPENAI_API_KEY not set in environment")
+            from langchain_openai import ChatOpenAI
+
             return ChatOpenAI(
                 api_key=self.openai_api_key,
                 model=self.openai_model,
                 temperature=temperature,
+                http_async_client=self._http_client,
             )
 
         elif provider == "anthropic":
             if not self.anthropic_api_key:
                 raise ValueError("ANTHROPIC_API_KEY not set in environment")
+            from langchain_anthropic import ChatAnthropic
+
             return ChatAnthropic(
                 api_key=self.anthropic_api_key,
                 model=self.anthropic_model,
@@ -50,6 +90,8 @@ class ModelConfig:
             )
 
         elif provider == "ollama":
+            from langchain_ollama import ChatOllama
+
             return ChatOllama(
                 model=self.ollama_model,
                 base_url=self.ollama_base_url,
@@ -59,33 +101,48 @@ class ModelConfig:
         else:
             raise ValueError(f"Unknown provider: {provider}")
 
-    def get_all_models(self) -> dict[str, BaseChatModel]:
-        """Get all available models"""
-        models = {}
+    async def get_all_models_async(self) -> dict[str, BaseChatModel]:
+        """Get all available models, initializing providers concurrently"""
+        providers = ["openai", "anthropic", "ollama"]
+
+        # Constructors may do network work; run them off-loop in parallel
+        # so startup costs max() of the providers rather than sum()
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.get_model, provider) for provider in providers),
+            return_exceptions=True,
+        )
 
-        # Try to initialize each model
-        for provider in ["openai", "anthropic", "ollama"]:
-            try:
-                models[provider] = self.get_model(provider)
+        models = {}
+        for provider, result in zip(providers, results):
+            if isinstance(result, Exception):
+                print(f"✗ {provider.capitalize()} model failed: {result}")
+            else:
+                models[provider] = result
                 print(f"✓ {provider.capitalize()} model initialized")
-            except Exception as e:
-                print(f"✗ {provider.capitalize()} model failed: {e}")
 
         return models
 
+    def get_all_models(self) -> dict[str, BaseChatModel]:
+        """Get all available models (sync wrapper for non-async callers)"""
+        return asyncio.run(self.get_all_models_async())
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        await self._http_client.aclose()
+
 
 # Global config instance
 config = ModelConfig()
 
 
-def setup_and_get_models():
+async def setup_and_get_models():
     """Setup environment and get all available models"""
     print("LangChain Multi-Model Examples")
     print("==============================")
     print(f"Primary provider: {config.provider}")
 
     # Get available models
-    models = config.get_all_models()
+    models = await config.get_all_models_async()
     if not models:
         print("No models available! Please check your configuration.")
         return None
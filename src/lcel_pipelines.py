@@ -1,5 +1,6 @@
 """LCEL (LangChain Expression Language) pipeline examples"""
 
+import asyncio
 from typing import Dict
 
 from langchain_core.language_models import BaseChatModel
@@ -15,6 +16,9 @@ from langchain_core.runnables import (
 async def demonstrate_lcel_pipelines(models: Dict[str, BaseChatModel]):
     """Demonstrate LCEL pipeline patterns"""
 
+    # Snapshot the models once for the loops below
+    model_items = tuple(models.items())
+
     # Basic pipeline
     print("=== Basic LCEL Pipeline ===\n")
 
@@ -23,17 +27,21 @@ async def demonstrate_lcel_pipelines(models: Dict[str, BaseChatModel]):
     )
     output_parser = StrOutputParser()
 
-    # Create chains for each model
-    for name, model in models.items():
-        chain = prompt | model | output_parser
+    # Build all chains up front and fan out the calls so the providers
+    # respond in parallel
+    chains = {name: prompt | model | output_parser for name, model in model_items}
+    payload = {"adjective": "interesting", "topic": "artificial intelligence"}
 
-        try:
-            result = await chain.ainvoke(
-                {"adjective": "interesting", "topic": "artificial intelligence"}
-            )
+    results = await asyncio.gather(
+        *(chain.ainvoke(payload) for chain in chains.values()),
+        return_exceptions=True,
+    )
+
+    for name, result in zip(chains, results):
+        if isinstance(result, Exception):
+            print(f"{name} error: {result}\n")
+        else:
             print(f"{name}: {result}\n")
-        except Exception as e:
-            print(f"{name} error: {e}\n")
 
     # Parallel execution
     print("\n=== Parallel Execution ===\n")
@@ -44,7 +52,7 @@ async def demonstrate_lcel_pipelines(models: Dict[str, BaseChatModel]):
 
     # Create parallel chain with all models
     parallel_chains = {}
-    for name, model in models.items():
+    for name, model in model_items:
         parallel_chains[name] = summary_prompt | model | output_parser
     parallel_chains["original"] = RunnablePassthrough()
 
@@ -76,8 +84,8 @@ async def demonstrate_lcel_pipelines(models: Dict[str, BaseChatModel]):
             text = x.get("text", "")
         else:
             # If it's already a formatted prompt, extract text from it
-            text = str(x) if hasattr(x, '__str__') else ""
-        
+            text = str(x) if hasattr(x, "__str__") else ""
+
         if len(text) < 50:
             return list(models.values())[0]  # First available model
         else:
@@ -129,7 +137,7 @@ if __name__ == "__main__":
     from src.config import setup_and_get_models
 
     async def main():
-        models = setup_and_get_models()
+        models = await setup_and_get_models()
         if models:
             print("\n" + "=" * 60)
             print("  LCEL Pipelines")
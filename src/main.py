@@ -24,28 +24,31 @@ async def main():
     print(f"Primary provider: {config.provider}")
 
     # Get available models
-    models = config.get_all_models()
+    models = await config.get_all_models_async()
     if not models:
         print("No models available! Please check your configuration.")
         return
 
     print(f"\nAvailable models: {list(models.keys())}")
 
-    # Run demonstrations
-    print_section("1. Basic Chat Interactions")
-    await demonstrate_basic_chat(models)
+    try:
+        # Run demonstrations
+        print_section("1. Basic Chat Interactions")
+        await demonstrate_basic_chat(models)
 
-    print_section("2. LCEL Pipelines")
-    await demonstrate_lcel_pipelines(models)
+        print_section("2. LCEL Pipelines")
+        await demonstrate_lcel_pipelines(models)
 
-    print_section("3. Structured Outputs")
-    await demonstrate_structured_outputs(models)
+        print_section("3. Structured Outputs")
+        await demonstrate_structured_outputs(models)
 
-    print_section("4. Tool Usage")
-    await demonstrate_tool_usage(models)
+        print_section("4. Tool Usage")
+        await demonstrate_tool_usage(models)
 
-    print_section("5. Research Assistant")
-    await demonstrate_research_assistant(models)
+        print_section("5. Research Assistant")
+        await demonstrate_research_assistant(models)
+    finally:
+        await config.aclose()
 
     print("\n✅ All demonstrations complete!")
 
@@ -1,18 +1,141 @@
 """Tool usage and function calling examples"""
 
+import ast
+import asyncio
+import functools
+import hashlib
 import json
 import math
 import random
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
+
+from zoneinfo import ZoneInfo
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import HumanMessage, ToolMessage
+from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.tools import tool
 
+# Grabs the JSON object embedded in a free-text model response
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Structured prompt that simulates tool usage for non-tool models,
+# built once at import (literal JSON braces are doubled to escape them)
+_FALLBACK_PROMPT = ChatPromptTemplate.from_template(
+    """You are an AI assistant. When asked about weather, time, or calculations,
+        provide a response in this JSON format:
+        {{
+            "tool_needed": "tool_name",
+            "parameters": {{"param": "value"}},
+            "explanation": "what you would do with this tool"
+        }}
+
+        Available tools:
+        - get_weather: Get weather for a city
+        - calculate: Perform calculations
+        - get_time: Get current time
+        - search_knowledge: Search information
+
+        Query: {query}"""
+)
+
+# Names a math expression may reference, built once at import
+_ALLOWED_NAMES = {k: v for k, v in math.__dict__.items() if not k.startswith("__")}
+_ALLOWED_NAMES["abs"] = abs
+_ALLOWED_NAMES["round"] = round
+
+# AST nodes a math expression may contain
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.operator,
+    ast.unaryop,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+    ast.Call,
+    ast.Tuple,
+    ast.keyword,
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_expression(expression: str):
+    """Validate a math expression's AST and cache the compiled code.
+
+    Repeated expressions skip lex/parse/compile entirely, and the walk
+    rejects anything beyond whitelisted arithmetic (no attribute access,
+    no unknown names, no indirect calls).
+    """
+    tree = ast.parse(expression, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Disallowed syntax: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id not in _ALLOWED_NAMES:
+            raise ValueError(f"Unknown name: {node.id}")
+        if isinstance(node, ast.Call) and not isinstance(node.func, ast.Name):
+            raise ValueError("Only direct function calls are allowed")
+    return compile(tree, "<calc>", "eval")
+
+
+# Timestamp format plus a ZoneInfo cache so repeated get_time calls
+# don't re-read the tz database files
+_TIME_FMT = "%Y-%m-%d %H:%M:%S"
+_TZ_CACHE: Dict[str, ZoneInfo] = {}
+
+# Simulated knowledge base, built once at import
+_KNOWLEDGE_BASE = {
+    "langchain": "LangChain is a framework for developing applications powered by language models.",
+    "python": "Python is a high-level programming language known for its simplicity.",
+    "ai": "Artificial Intelligence is the simulation of human intelligence by machines.",
+}
+
+# Simulated weather data: dedicated RNG (no global-state contention)
+# and a constant conditions tuple built once at import
+_RNG = random.Random()
+_CONDITIONS = ("Sunny", "Cloudy", "Rainy", "Partly Cloudy")
+
+# Tool-result cache: repeated calls with the same arguments inside the
+# freshness window return instantly instead of re-running the tool
+_TOOL_CACHE: dict = {}
+
+
+def _cached(ttl: Optional[float]):
+    """Memoize a tool function's results for ttl seconds (None = forever).
+
+    Keyed on the function name and its arguments. Real-time tools like
+    get_time must not use this.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = _TOOL_CACHE.get(key)
+            if hit is not None and (ttl is None or now - hit[0] < ttl):
+                return hit[1]
+            result = fn(*args, **kwargs)
+            _TOOL_CACHE[key] = (now, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
 
 # Define tools
 @tool
+@_cached(ttl=300)  # weather changes slowly
 def get_weather(city: str) -> str:
     """Get current weather for a city.
 
@@ -22,12 +145,13 @@ def get_weather(city: str) -> str:
     Returns:
         Weather description and temperature
     """
-    conditions = ["Sunny", "Cloudy", "Rainy", "Partly Cloudy"]
-    temp = random.randint(15, 30)
-    return f"{city}: {random.choice(conditions)}, {temp}°C"
+    cond = _CONDITIONS[_RNG.randrange(4)]
+    temp = _RNG.randrange(15, 31)
+    return f"{city}: {cond}, {temp}°C"
 
 
 @tool
+@_cached(ttl=None)  # pure function of the expression
 def calculate(expression: str) -> str:
     """Safely evaluate a mathematical expression.
 
@@ -38,14 +162,9 @@ def calculate(expression: str) -> str:
         Result of the calculation
     """
     try:
-        # Safe evaluation with math functions
-        allowed_names = {
-            k: v for k, v in math.__dict__.items() if not k.startswith("__")
-        }
-        allowed_names["abs"] = abs
-        allowed_names["round"] = round
-
-        result = eval(expression, {"__builtins__": {}}, allowed_names)
+        # Safe evaluation against the precompiled, AST-whitelisted code
+        code = _compile_expression(expression)
+        result = eval(code, {"__builtins__": {}}, _ALLOWED_NAMES)
         return f"Result: {result}"
     except Exception as e:
         return f"Error: {str(e)}"
@@ -61,11 +180,20 @@ def get_time(timezone: str = "UTC") -> str:
     Returns:
         Current time as string
     """
-    # Simplified - returns local time
-    return f"Current time in {timezone}: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    tz = _TZ_CACHE.get(timezone)
+    if tz is None:
+        try:
+            tz = ZoneInfo(timezone)
+        except (KeyError, ValueError):
+            # Unknown zone name - fall back to UTC
+            tz = ZoneInfo("UTC")
+        _TZ_CACHE[timezone] = tz
+
+    return f"Current time in {timezone}: {datetime.now(tz).strftime(_TIME_FMT)}"
 
 
 @tool
+@_cached(ttl=None)  # static knowledge base
 def search_knowledge(query: str) -> str:
     """Search internal knowledge base.
 
@@ -75,50 +203,96 @@ def search_knowledge(query: str) -> str:
     Returns:
         Relevant information
     """
-    # Simulated knowledge base
-    knowledge = {
-        "langchain": "LangChain is a framework for developing applications powered by language models.",
-        "python": "Python is a high-level programming language known for its simplicity.",
-        "ai": "Artificial Intelligence is the simulation of human intelligence by machines.",
-    }
-
     query_lower = query.lower()
-    for key, value in knowledge.items():
-        if key in query_lower:
-            return value
+    hit = next((key for key in _KNOWLEDGE_BASE if key in query_lower), None)
+    if hit is not None:
+        return _KNOWLEDGE_BASE[hit]
 
     return f"No information found for '{query}'"
 
 
+# bind_tools rebuilds the provider tool schemas on every call, which is
+# pure waste for a constant tool list. Cache the bound models with LRU
+# eviction, keyed by model instance and an order-independent fingerprint
+# of the tool set.
+_BIND_CACHE: OrderedDict = OrderedDict()
+_BIND_CACHE_SIZE = 128
+
+
+def _tool_signature(tools) -> str:
+    """Order-independent fingerprint of a tool list"""
+    entries = sorted((t.name, str(t.args_schema.model_json_schema())) for t in tools)
+    return hashlib.sha256(json.dumps(entries).encode()).hexdigest()
+
+
+def _cached_bind_tools(model: BaseChatModel, tools) -> BaseChatModel:
+    """bind_tools with caching across repeated demo invocations"""
+    key = (id(model), _tool_signature(tools))
+    bound = _BIND_CACHE.get(key)
+    if bound is None:
+        bound = model.bind_tools(tools)
+        _BIND_CACHE[key] = bound
+        if len(_BIND_CACHE) > _BIND_CACHE_SIZE:
+            _BIND_CACHE.popitem(last=False)
+    else:
+        _BIND_CACHE.move_to_end(key)
+    return bound
+
+
 async def demonstrate_tool_usage(models: Dict[str, BaseChatModel]):
     """Demonstrate tool usage with different models"""
 
+    # Message classes are only needed once the demo actually runs
+    from langchain_core.messages import HumanMessage, ToolMessage
+
     tools = [get_weather, calculate, get_time, search_knowledge]
+    tool_registry = {t.name: t for t in tools}
+
+    # Snapshot the models once for the loops below
+    model_items = tuple(models.items())
 
     print("=== Tool Availability Check ===\n")
 
     # Check which models support tools - exclude ollama from tool testing
-    tool_capable_models = {}
-    excluded_models = []
-
-    for name, model in models.items():
-        # Skip ollama models for tool usage since they don't support LangChain function calling
-        if name == "ollama":
-            excluded_models.append(name)
-            print(f"⚠️  {name}: Skipped (LangChain tool binding not supported)")
-            continue
-            
+    # since it doesn't support LangChain function calling
+    excluded_models = [name for name, _ in model_items if name == "ollama"]
+    for name in excluded_models:
+        print(f"⚠️  {name}: Skipped (LangChain tool binding not supported)")
+
+    def _safe_bind(name: str, model: BaseChatModel) -> tuple:
+        """Bind tools, returning the bound model or the error"""
         try:
-            model_with_tools = model.bind_tools(tools)
-            tool_capable_models[name] = model_with_tools
-            print(f"✓ {name}: Tool support available")
+            return name, _cached_bind_tools(model, tools)
         except Exception as e:
-            print(f"✗ {name}: No tool support - {type(e).__name__}")
+            return name, e
+
+    # bind_tools is synchronous CPU work (pydantic schema conversion),
+    # so run the probes in worker threads instead of blocking the loop
+    probed = await asyncio.gather(
+        *(
+            asyncio.to_thread(_safe_bind, name, model)
+            for name, model in model_items
+            if name not in excluded_models
+        )
+    )
+
+    tool_capable_models = {}
+    for name, result in probed:
+        if isinstance(result, Exception):
+            print(f"✗ {name}: No tool support - {type(result).__name__}")
+        else:
+            tool_capable_models[name] = result
+            print(f"✓ {name}: Tool support available")
 
     if not tool_capable_models:
         print("\nNo models with tool support available!")
         return
 
+    # Each model is bound to the tools exactly once above; every section
+    # below must reuse those same objects. Snapshot their identities so a
+    # refactor that sneaks per-query bind_tools back in fails loudly.
+    bound_ids = {name: id(model) for name, model in tool_capable_models.items()}
+
     print("\n=== Simple Tool Usage ===\n")
 
     # Test simple tool calls
@@ -129,125 +303,189 @@ async def demonstrate_tool_usage(models: Dict[str, BaseChatModel]):
         "Tell me about LangChain",
     ]
 
-    for query in test_queries:
-        print(f"Query: {query}")
-
-        for name, model in tool_capable_models.items():
-            print(f"\n{name}:")
-
-            try:
-                # Initial response
-                response = await model.ainvoke(query)
+    async def invoke_streaming(model: BaseChatModel, messages):
+        """Stream a response, merging the chunks as they arrive.
 
-                if hasattr(response, "tool_calls") and response.tool_calls:
-                    print(f"Tool calls requested: {len(response.tool_calls)}")
+        The first tokens become available as soon as the provider emits
+        them instead of after the full generation; falls back to a
+        blocking call when the provider cannot stream.
+        """
+        try:
+            response = None
+            async for chunk in model.astream(messages):
+                response = chunk if response is None else response + chunk
+            if response is not None:
+                return response
+        except NotImplementedError:
+            pass
+        return await model.ainvoke(messages)
+
+    async def execute_tool_calls(tool_calls, messages):
+        """Run independent tool calls concurrently and append the results"""
+        # Pull each field out of the call dicts once up front; the loops
+        # below then only touch fast locals
+        calls = [(tc["name"], tc["args"], tc["id"]) for tc in tool_calls]
+        results = await asyncio.gather(
+            *(tool_registry[tname].ainvoke(targs) for tname, targs, _ in calls),
+            return_exceptions=True,
+        )
+        messages.extend(
+            ToolMessage(content=str(result), tool_call_id=tcid)
+            for (_, _, tcid), result in zip(calls, results)
+        )
+
+    async def run_query(
+        name: str, model: BaseChatModel, human_message, response
+    ) -> list:
+        """Process one model's response to one query, returning output lines"""
+        lines = [f"\n{name}:"]
+
+        if isinstance(response, Exception):
+            lines.append(f"Error: {response}")
+            return lines
 
-                    # Execute tools
-                    messages = [HumanMessage(content=query), response]
+        try:
+            if hasattr(response, "tool_calls") and response.tool_calls:
+                lines.append(f"Tool calls requested: {len(response.tool_calls)}")
 
-                    for tool_call in response.tool_calls:
-                        print(f"- Calling {tool_call['name']} with {tool_call['args']}")
+                # Execute tools (the query message is shared across models)
+                messages = [human_message, response]
 
-                        # Execute tool
-                        tool_fn = globals()[tool_call["name"]]
-                        result = tool_fn.invoke(tool_call["args"])
+                for tool_call in response.tool_calls:
+                    tname, targs = tool_call["name"], tool_call["args"]
+                    lines.append(f"- Calling {tname} with {targs}")
+                await execute_tool_calls(response.tool_calls, messages)
+
+                # Get final response - handle multiple tool call rounds
+                max_iterations = 3
+                iteration = 0
+                final_response = None
+
+                while iteration < max_iterations:
+                    final_response = await invoke_streaming(model, messages)
+
+                    # If we get content, we're done
+                    if final_response.content:
+                        lines.append(f"Final answer: {final_response.content}")
+                        break
+
+                    # If we get more tool calls, execute them
+                    if (
+                        hasattr(final_response, "tool_calls")
+                        and final_response.tool_calls
+                    ):
+                        messages.append(final_response)
+                        await execute_tool_calls(final_response.tool_calls, messages)
+                        iteration += 1
+                    else:
+                        # No content and no tool calls - show full response
+                        lines.append(f"Final answer: {str(final_response)}")
+                        break
+
+                if iteration >= max_iterations and final_response:
+                    lines.append(
+                        f"Final answer: Reached max iterations, last response: "
+                        f"{final_response.content or 'No content'}"
+                    )
+            else:
+                lines.append(f"Direct response: {response.content[:100]}...")
 
-                        # Add result
-                        messages.append(
-                            ToolMessage(
-                                content=str(result), tool_call_id=tool_call["id"]
-                            )
-                        )
-
-                    # Get final response - handle multiple tool call rounds
-                    max_iterations = 3
-                    iteration = 0
-                    final_response = None
-                    
-                    while iteration < max_iterations:
-                        final_response = await model.ainvoke(messages)
-                        
-                        # If we get content, we're done
-                        if final_response.content:
-                            print(f"Final answer: {final_response.content}")
-                            break
-                            
-                        # If we get more tool calls, execute them
-                        if hasattr(final_response, "tool_calls") and final_response.tool_calls:
-                            messages.append(final_response)
-                            for tool_call in final_response.tool_calls:
-                                tool_fn = globals()[tool_call["name"]]
-                                result = tool_fn.invoke(tool_call["args"])
-                                messages.append(
-                                    ToolMessage(content=str(result), tool_call_id=tool_call["id"])
-                                )
-                            iteration += 1
-                        else:
-                            # No content and no tool calls - show full response
-                            print(f"Final answer: {str(final_response)}")
-                            break
-                    
-                    if iteration >= max_iterations and final_response:
-                        print(f"Final answer: Reached max iterations, last response: {final_response.content or 'No content'}")
-                else:
-                    print(f"Direct response: {response.content[:100]}...")
+        except Exception as e:
+            lines.append(f"Error: {e}")
+
+        return lines
+
+    # One abatch per model dispatches every query at once, and the
+    # per-model batches themselves run in parallel
+    batches = await asyncio.gather(
+        *(
+            model.abatch(
+                test_queries,
+                config={"max_concurrency": 8},
+                return_exceptions=True,
+            )
+            for model in tool_capable_models.values()
+        ),
+        return_exceptions=True,
+    )
+
+    responses_by_model = {}
+    for name, batch in zip(tool_capable_models, batches):
+        if isinstance(batch, Exception):
+            batch = [batch] * len(test_queries)
+        responses_by_model[name] = batch
+
+    for query_index, query in enumerate(test_queries):
+        print(f"Query: {query}")
 
-            except Exception as e:
-                print(f"Error: {e}")
+        # One HumanMessage per query, reused by every model processing it
+        human_message = HumanMessage(content=query)
+
+        # Tool dispatch still fans out across models; output is buffered
+        # per model so the concurrent runs don't interleave
+        per_model = await asyncio.gather(
+            *(
+                run_query(
+                    name, model, human_message, responses_by_model[name][query_index]
+                )
+                for name, model in tool_capable_models.items()
+            )
+        )
+        for lines in per_model:
+            print("\n".join(lines))
 
         print("\n" + "-" * 50 + "\n")
 
     print("\n=== Multi-Tool Usage ===\n")
 
     complex_query = "What's the weather in London and New York, and what's 15% of 847?"
+    complex_message = HumanMessage(content=complex_query)
 
-    for name, model in tool_capable_models.items():
-        print(f"{name}:")
+    async def run_complex(name: str, model: BaseChatModel) -> list:
+        """Run the multi-tool query on one model, returning output lines"""
+        lines = [f"{name}:"]
 
         try:
             response = await model.ainvoke(complex_query)
 
             if hasattr(response, "tool_calls") and response.tool_calls:
-                print(f"Tools requested: {[tc['name'] for tc in response.tool_calls]}")
+                lines.append(
+                    f"Tools requested: {[tc['name'] for tc in response.tool_calls]}"
+                )
 
-                messages = [HumanMessage(content=complex_query), response]
+                messages = [complex_message, response]
 
-                # Execute all tools
-                for tool_call in response.tool_calls:
-                    tool_fn = globals()[tool_call["name"]]
-                    result = tool_fn.invoke(tool_call["args"])
-
-                    messages.append(
-                        ToolMessage(content=str(result), tool_call_id=tool_call["id"])
-                    )
+                # Execute all tools concurrently
+                await execute_tool_calls(response.tool_calls, messages)
 
                 # Final response
-                final = await model.ainvoke(messages)
-                print(f"Answer: {final.content}\n")
+                final = await invoke_streaming(model, messages)
+                lines.append(f"Answer: {final.content}\n")
 
         except Exception as e:
-            print(f"Error: {e}\n")
+            lines.append(f"Error: {e}\n")
+
+        return lines
+
+    per_model = await asyncio.gather(
+        *(run_complex(name, model) for name, model in tool_capable_models.items())
+    )
+    for lines in per_model:
+        print("\n".join(lines))
+
+    # Every section reused the originally bound models
+    assert bound_ids == {
+        name: id(model) for name, model in tool_capable_models.items()
+    }, "tool-bound models were rebuilt mid-demo"
 
     # Demonstrate fallback for non-tool models
     if len(tool_capable_models) < len(models):
         print("\n=== Fallback Strategy for Non-Tool Models ===\n")
 
-        # Create a structured prompt that simulates tool usage
-        fallback_prompt = """You are an AI assistant. When asked about weather, time, or calculations,
-        provide a response in this JSON format:
-        {
-            "tool_needed": "tool_name",
-            "parameters": {"param": "value"},
-            "explanation": "what you would do with this tool"
-        }
-        
-        Available tools:
-        - get_weather: Get weather for a city
-        - calculate: Perform calculations
-        - get_time: Get current time
-        - search_knowledge: Search information
-        
-        Query: What's the weather in Berlin?"""
+        # Format the prebuilt structured prompt for this query
+        fallback_messages = _FALLBACK_PROMPT.format_messages(
+            query="What's the weather in Berlin?"
+        )
 
         # Try with a non-tool model
         non_tool_models = {
@@ -259,17 +497,15 @@ async def demonstrate_tool_usage(models: Dict[str, BaseChatModel]):
             print(f"Using {model_name} with structured prompt fallback:\n")
 
             try:
-                response = await model.ainvoke(fallback_prompt)
+                response = await model.ainvoke(fallback_messages)
                 print(f"Response: {response.content}")
 
                 # Try to parse the response
                 try:
                     # Extract JSON from response
-                    import re
-
-                    json_match = re.search(r"\{.*\}", response.content, re.DOTALL)
+                    json_match = _JSON_RE.search(response.content)
                     if json_match:
-                        tool_request = json.loads(json_match.group())
+                        tool_request = _json_loads(json_match.group())
                         print(f"\nParsed tool request: {tool_request}")
 
                         # Simulate tool execution
@@ -279,8 +515,9 @@ async def demonstrate_tool_usage(models: Dict[str, BaseChatModel]):
                             )
                             result = get_weather.invoke({"city": city})
                             print(f"Tool result: {result}")
-                except Exception as e:
-                    print(f"Could not parse structured response {e}")
+                except (ValueError, KeyError, TypeError) as e:
+                    # JSONDecodeError (json and orjson) subclasses ValueError
+                    print(f"Could not parse structured response: {e}")
 
             except Exception as e:
                 print(f"Fallback error: {e}")
@@ -292,7 +529,7 @@ if __name__ == "__main__":
     from src.config import setup_and_get_models
 
     async def main():
-        models = setup_and_get_models()
+        models = await setup_and_get_models()
         if models:
             print("\n" + "=" * 60)
             print("  Tool Usage")
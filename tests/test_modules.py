@@ -1,6 +1,6 @@
 """Unit tests for LangChain multi-model examples"""
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -45,12 +45,27 @@ class TestTools:
         result = calculate.invoke({"expression": "invalid"})
         assert "Error" in result
 
+    def test_calculate_tool_rejects_unsafe_expressions(self):
+        """Test that non-arithmetic expressions are rejected"""
+        for expression in [
+            "__import__('os')",
+            "().__class__",
+            "[x for x in (1,)]",
+        ]:
+            result = calculate.invoke({"expression": expression})
+            assert "Error" in result
+
     def test_time_tool(self):
         """Test time tool"""
         result = get_time.invoke({"timezone": "UTC"})
         assert "Current time" in result
         assert "UTC" in result
 
+        # A non-UTC zone must yield a different wall-clock time
+        tokyo = get_time.invoke({"timezone": "Asia/Tokyo"})
+        assert "Asia/Tokyo" in tokyo
+        assert tokyo.split(": ", 1)[1] != result.split(": ", 1)[1]
+
 
 class TestStructuredOutputs:
     """Test Pydantic model validation"""
@@ -130,11 +145,12 @@ class TestAsyncFunctions:
 
         # Mock models
         mock_model = Mock()
-        mock_model.invoke.return_value = Mock(content="Test response")
+        mock_model.ainvoke = AsyncMock(return_value=Mock(content="Test response"))
+        mock_model.model_copy.return_value = mock_model
         mock_model.astream.return_value = [Mock(content="Chunk")]
 
         models = {"test": mock_model}
 
         # Should not raise exceptions
         await demonstrate_basic_chat(models)
-        assert mock_model.invoke.called
+        assert mock_model.ainvoke.called